@@ -0,0 +1,99 @@
+"""Cold-start guard: the libraries and the Streamlit entrypoint must import cheaply.
+
+Run from the repo root:  python benchmarks/import_time.py [--budget-ms 50] [--ui-budget-ms 1500]
+
+Each sample is a fresh interpreter, so nothing is cached in sys.modules.
+Two probes run:
+
+  libraries   import calc, storage   -- no heavy dependency at all
+  entrypoint  import ui              -- streamlit allowed; nothing else heavy
+
+For the entrypoint, streamlit is imported first and whatever it loads by
+itself is not held against ui.py; any heavy module that appears only once
+ui is imported (e.g. a top-level `import gspread` or `import pandas`) fails.
+The entrypoint probe is skipped, loudly, when streamlit is not installed.
+
+Exits non-zero if a median exceeds its budget or a heavy dependency was
+pulled in eagerly.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY = ("gspread", "google.oauth2", "google.auth", "pytz", "pandas", "numpy", "streamlit")
+
+PROBE = """
+import importlib, json, sys, time
+heavy = {heavy!r}
+try:
+    for m in {preload!r}:
+        importlib.import_module(m)
+except ImportError as e:
+    print(json.dumps({{"skip": str(e)}}))
+    sys.exit(0)
+already = {{m for m in heavy if m in sys.modules}}
+t0 = time.perf_counter()
+for m in {modules!r}:
+    importlib.import_module(m)
+dt = time.perf_counter() - t0
+print(json.dumps({{"ms": dt * 1000.0, "heavy": [m for m in heavy if m in sys.modules and m not in already]}}))
+"""
+
+# (label, modules, preloaded + allowed modules, budget arg)
+PROBES = (
+    ("libraries", ("calc", "storage"), (), "budget_ms"),
+    ("entrypoint", ("ui",), ("streamlit",), "ui_budget_ms"),
+)
+
+
+def sample(modules, preload=()):
+    code = PROBE.format(modules=list(modules), preload=list(preload),
+                        heavy=[m for m in HEAVY if m not in preload])
+    out = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT)
+    return json.loads(out)
+
+
+def run_probe(label, modules, preload, runs, budget):
+    """Print one probe's result; return True if it failed."""
+    first = sample(modules, preload)
+    if "skip" in first:
+        print(f"SKIP {label}: {first['skip']}")
+        return False
+    results = [first] + [sample(modules, preload) for _ in range(runs - 1)]
+    times = [r["ms"] for r in results]
+    heavy = sorted({m for r in results for m in r["heavy"]})
+    med = statistics.median(times)
+    extra = f" (after {', '.join(preload)})" if preload else ""
+    print(f"{label}: import {', '.join(modules)}{extra}: median {med:.2f} ms, "
+          f"min {min(times):.2f} ms, max {max(times):.2f} ms over {runs} runs")
+
+    failed = False
+    if heavy:
+        print(f"FAIL {label}: heavy modules imported eagerly: {', '.join(heavy)}")
+        failed = True
+    if med > budget:
+        print(f"FAIL {label}: median {med:.2f} ms exceeds budget {budget:.2f} ms")
+        failed = True
+    return failed
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=15)
+    ap.add_argument("--budget-ms", type=float, default=50.0, help="calc + storage")
+    ap.add_argument("--ui-budget-ms", type=float, default=1500.0, help="ui on top of streamlit")
+    args = ap.parse_args(argv)
+
+    failed = False
+    for label, modules, preload, budget in PROBES:
+        failed |= run_probe(label, modules, preload, args.runs, getattr(args, budget))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
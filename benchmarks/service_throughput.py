@@ -0,0 +1,107 @@
+"""Throughput of the JSON calculation service (service.py).
+
+Run from the repo root:  python benchmarks/service_throughput.py [--seconds 5] [--conns 32]
+
+Starts the service in a separate process (one core) and drives it with
+keep-alive asyncio clients from this process. Reports single-request
+req/s and batched items/s; inputs are drawn from a pool of distinct plans
+so the result cache does not turn it into a pure echo test.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def _inputs(rng):
+    age = rng.randint(18, 60)
+    retire = rng.randint(age + 1, 75)
+    return {
+        "age_now": age, "age_retire": retire, "life_expectancy": rng.randint(retire + 1, 100),
+        "infl_pct": float(rng.randint(0, 12)), "monthly_exp": float(rng.randrange(10_000, 500_000, 1_000)),
+        "current_invest": float(rng.randrange(0, 10_000_000, 10_000)), "legacy_goal": 0.0,
+    }
+
+def _request(port, payload, ndjson=False):
+    body = json.dumps(payload).encode()
+    head = (f"POST /v1/plan HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+            + ("Accept: application/x-ndjson\r\n" if ndjson else "") + "\r\n")
+    return head.encode() + body
+
+async def _read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    if b"chunked" in head.lower():
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).strip(), 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                return status
+    length = int(head.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+    await reader.readexactly(length)
+    return status
+
+async def _client(port, requests, deadline, counter):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    i = 0
+    while time.perf_counter() < deadline:
+        writer.write(requests[i % len(requests)])
+        status = await _read_response(reader)
+        if status != 200:
+            raise RuntimeError(f"HTTP {status}")
+        counter[0] += 1
+        i += 1
+    writer.close()
+
+async def _drive(port, requests, seconds, conns):
+    counter = [0]
+    t0 = time.perf_counter()
+    deadline = t0 + seconds
+    await asyncio.gather(*(_client(port, requests[c::conns] or requests, deadline, counter) for c in range(conns)))
+    return counter[0] / (time.perf_counter() - t0)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--conns", type=int, default=32)
+    ap.add_argument("--pool", type=int, default=20_000, help="distinct input sets")
+    ap.add_argument("--batch", type=int, default=1_000)
+    args = ap.parse_args(argv)
+
+    rng = random.Random(0)
+    pool = [_inputs(rng) for _ in range(args.pool)]
+    port = _free_port()
+    proc = subprocess.Popen([sys.executable, "-m", "service", "--port", str(port)], cwd=ROOT,
+                            stdout=subprocess.PIPE)
+    try:
+        proc.stdout.readline()  # "listening on ..."
+        single = [_request(port, p) for p in pool]
+        batches = [_request(port, pool[i:i + args.batch], ndjson=True)
+                   for i in range(0, len(pool), args.batch)]
+
+        rps = asyncio.run(_drive(port, single, args.seconds, args.conns))
+        print(f"single : {rps:10.0f} req/s  ({args.conns} keep-alive conns)")
+        bps = asyncio.run(_drive(port, batches, args.seconds, min(args.conns, 4)))
+        print(f"batched: {bps * args.batch:10.0f} items/s (NDJSON, {args.batch} per request)")
+    finally:
+        proc.terminate()
+        proc.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Per-session state footprint: loose session_state keys vs SessionModel.
+
+Run from the repo root:  python benchmarks/session_footprint.py [--sessions 5000]
+
+Streamlit keeps session_state as a dict per session, so the "loose" layout
+is modelled as one dict holding every key the page used to set. This is a
+lower bound: Streamlit's SessionState also tracks per-key metadata, which
+the single-key model avoids. Both layouts hold the same values.
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+from dataclasses import fields
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from session import SessionModel  # noqa: E402
+
+
+def _values(i):
+    return {
+        "signed_in": True,
+        "user_first_name": f"First{i}", "user_last_name": f"Last{i}",
+        "user_email": f"user{i}@example.com", "user_phone": f"98{i:08d}",
+        "prev_F19": 123_456_789 + i, "prev_F21": 45_678 + i, "prev_F22": 2_345_678 + i,
+        "prev_F25": 1_234 + i, "prev_F26": 98_765 + i,
+        "prev_total_monthly": 46_912 + i, "prev_total_lumpsum": 2_444_443 + i,
+        "prev_snap_fv": 3_456_789 + i, "prev_snap_gap": 120_000_000 + i,
+        "prev_show_totals": bool(i % 2), "saving": False, "last_save_time": 1.7e9 + i,
+        # The Workspace object itself is shared storage state, not per-key
+        # overhead; both layouts hold the same reference.
+        "workspace": None, "workspace_id": f"{i:032x}",
+    }
+
+
+def measure(build, n):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    keep = [build(i) for i in range(n)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(s.size_diff for s in after.compare_to(before, "filename"))
+    del keep
+    return total / n
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sessions", type=int, default=5000)
+    args = ap.parse_args(argv)
+
+    names = [f.name for f in fields(SessionModel)]
+    missing = set(names) - set(_values(0))
+    if missing:
+        ap.error(f"_values() does not cover: {', '.join(sorted(missing))}")
+    loose = measure(lambda i: dict(_values(i)), args.sessions)
+    model = measure(lambda i: SessionModel(**_values(i)), args.sessions)
+
+    print(f"{len(_values(0))} fields measured, {args.sessions} sessions")
+    print(f"loose keys   : {loose:8.1f} B/session")
+    print(f"SessionModel : {model:8.1f} B/session")
+    print(f"saving       : {loose - model:8.1f} B/session ({(1 - model / loose) * 100:.1f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
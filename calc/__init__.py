@@ -0,0 +1,14 @@
+"""Pure-Python retirement maths — no Streamlit, Sheets or pandas imports."""
+from calc.excel import FV, PV, PMT
+from calc.fmt import fmt_money_indian, number_to_words_short
+from calc.plan import RET_PRE_PCT, RET_POST_PCT, RET_EXIST_PCT, Plan, compute_plan
+from calc.scenarios import COMPARE_METRICS, Scenario, cached_plan, compare, evaluate
+from calc.bounds import validate_inputs
+
+__all__ = [
+    "FV", "PV", "PMT",
+    "fmt_money_indian", "number_to_words_short",
+    "RET_PRE_PCT", "RET_POST_PCT", "RET_EXIST_PCT", "Plan", "compute_plan",
+    "COMPARE_METRICS", "Scenario", "cached_plan", "compare", "evaluate",
+    "validate_inputs",
+]
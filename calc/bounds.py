@@ -0,0 +1,86 @@
+# =========================
+# Input bounds (shared by the number_input widgets and the JSON service)
+# =========================
+import math
+
+AGE_NOW = (16, 80)
+HARD_MAX_RETIRE = 90
+HARD_MAX_LIFE = 110
+INFL_PCT = (0.0, 20.0)
+MONTHLY_EXP = (0.0, 5_000_000.0)
+CURRENT_INVEST = (0.0, 1_000_000_000.0)
+LEGACY_GOAL = (0.0, 1_000_000_000.0)
+
+DEFAULTS = {
+    "age_now": 25, "age_retire": 60, "life_expectancy": 90, "infl_pct": 5.0,
+    "monthly_exp": 50_000.0, "current_invest": 0.0, "legacy_goal": 0.0,
+}
+
+
+def retire_age_bounds(age_now: int) -> tuple:
+    lo = age_now + 1
+    return lo, max(lo, HARD_MAX_RETIRE)
+
+def life_expectancy_bounds(age_retire: int) -> tuple:
+    lo = age_retire + 1
+    return max(0, lo), max(lo, HARD_MAX_LIFE)
+
+def clamp_default(value, bounds):
+    lo, hi = bounds
+    return min(max(value, lo), hi)
+
+
+def _int(d, key, errors):
+    v = d.get(key, DEFAULTS[key])
+    ok = not isinstance(v, bool) and (
+        isinstance(v, int) or (isinstance(v, float) and math.isfinite(v) and v.is_integer())
+    )
+    if not ok:
+        errors.append(f"{key}: expected an integer")
+        return None
+    return int(v)
+
+def _float(d, key, errors):
+    v = d.get(key, DEFAULTS[key])
+    try:
+        ok = not isinstance(v, bool) and isinstance(v, (int, float)) and math.isfinite(float(v))
+    except OverflowError:  # int too large for a float
+        ok = False
+    if not ok:
+        errors.append(f"{key}: expected a number")
+        return None
+    return float(v)
+
+def _check(key, v, bounds, errors) -> bool:
+    if v is None:
+        return False
+    if not (bounds[0] <= v <= bounds[1]):
+        shown = v if abs(v) < 1e15 else "value"
+        errors.append(f"{key}: {shown} not in [{bounds[0]}, {bounds[1]}]")
+        return False
+    return True
+
+def validate_inputs(d: dict) -> dict:
+    """Validate a JSON-ish mapping -> compute_plan kwargs. Raises ValueError."""
+    if not isinstance(d, dict):
+        raise ValueError("expected a JSON object")
+    unknown = set(d) - set(DEFAULTS)
+    errors = [f"{k}: unknown field" for k in sorted(unknown)]
+
+    age_now = _int(d, "age_now", errors)
+    age_retire = _int(d, "age_retire", errors)
+    life = _int(d, "life_expectancy", errors)
+    # Dependent bounds only make sense once the age they derive from is in range.
+    if _check("age_now", age_now, AGE_NOW, errors):
+        if _check("age_retire", age_retire, retire_age_bounds(age_now), errors):
+            _check("life_expectancy", life, life_expectancy_bounds(age_retire), errors)
+
+    out = {"age_now": age_now, "age_retire": age_retire, "life_expectancy": life}
+    for key, bounds in (("infl_pct", INFL_PCT), ("monthly_exp", MONTHLY_EXP),
+                        ("current_invest", CURRENT_INVEST), ("legacy_goal", LEGACY_GOAL)):
+        out[key] = _float(d, key, errors)
+        _check(key, out[key], bounds, errors)
+
+    if errors:
+        raise ValueError("; ".join(errors))
+    return out
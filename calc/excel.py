@@ -0,0 +1,12 @@
+# Excel parity helpers
+def _pow1p(x, n): return (1.0 + x) ** n
+def FV(rate, nper, pmt=0.0, pv=0.0, typ=0):
+    if abs(rate) < 1e-12: return -(pv + pmt * nper)
+    g = _pow1p(rate, nper); return -(pv * g + pmt * (1 + rate * typ) * (g - 1) / rate)
+def PV(rate, nper, pmt=0.0, fv=0.0, typ=0):
+    if abs(rate) < 1e-12: return -(fv + pmt * nper)
+    g = _pow1p(rate, nper); return -(fv + pmt * (1 + rate * typ) * (g - 1) / rate) / g
+def PMT(rate, nper, pv=0.0, fv=0.0, typ=0):
+    if nper <= 0: return 0.0
+    if abs(rate) < 1e-12: return -(fv + pv) / nper
+    g = _pow1p(rate, nper); return -(rate * (pv * g + fv)) / ((1 + rate * typ) * (g - 1))
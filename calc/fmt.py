@@ -0,0 +1,37 @@
+# =========================
+# Indian Number Formatting
+# =========================
+def fmt_money_indian(x):
+    try:
+        n = int(round(float(x)))
+    except Exception:
+        return f"₹{x}"
+    s = str(abs(n))
+    if len(s) <= 3:
+        out = s
+    else:
+        last3 = s[-3:]
+        rest = s[:-3]
+        parts = []
+        while len(rest) > 2:
+            parts.insert(0, rest[-2:])
+            rest = rest[:-2]
+        if rest:
+            parts.insert(0, rest)
+        out = ",".join(parts) + "," + last3
+    sign = "-" if n < 0 else ""
+    return f"₹{sign}{out}"
+
+def number_to_words_short(n: float) -> str:
+    try:
+        n = float(n)
+    except:
+        return ""
+    absn = abs(n)
+    if absn >= 1e7:  # crore
+        return f"{absn/1e7:.2f} crore"
+    if absn >= 1e5:  # lakh
+        return f"{absn/1e5:.2f} lakh"
+    if absn >= 1e3:  # thousand
+        return f"{absn/1e3:.2f} thousand"
+    return f"{absn:.0f}"
@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+
+from calc.excel import FV, PV, PMT
+
+# Fixed return assumptions (% p.a.) — shown as captions in the UI
+RET_PRE_PCT = 12.0
+RET_POST_PCT = 6.0
+RET_EXIST_PCT = 12.0
+
+
+@dataclass(frozen=True)
+class Plan:
+    # Inputs
+    age_now: int
+    age_retire: int
+    life_expectancy: int
+    infl_pct: float
+    monthly_exp: float
+    current_invest: float
+    legacy_goal: float
+    # Outputs (sheet cell names)
+    F17: float
+    F18: float
+    F19_base: float
+    FV_existing_at_ret: float
+    F20_base: float
+    F21_raw: float
+    F22_raw: float
+    F24: float
+    F25: float
+    F26: float
+    F19: float
+    coverage: float
+
+    @property
+    def years_left(self) -> int:
+        return max(0, self.age_retire - self.age_now)
+
+    @property
+    def yearly_exp(self) -> float:
+        return self.monthly_exp * 12.0
+
+    @property
+    def F21_display(self) -> float:
+        return max(self.F21_raw, 0.0)
+
+    @property
+    def F22_display(self) -> float:
+        return max(self.F22_raw, 0.0)
+
+    @property
+    def gap(self) -> float:
+        return max(self.F20_base, 0.0)
+
+    @property
+    def total_monthly_sip(self) -> float:
+        return self.F21_display + max(self.F25, 0.0)
+
+    @property
+    def total_lumpsum(self) -> float:
+        return self.F22_display + max(self.F26, 0.0)
+
+    @property
+    def show_totals(self) -> bool:
+        return (self.F25 > 1e-6) or (self.F26 > 1e-6)
+
+    @property
+    def status_class(self) -> str:
+        return "ok" if self.coverage >= 0.85 else ("warn" if self.coverage >= 0.5 else "bad")
+
+    @property
+    def status_text(self) -> str:
+        return {"ok": "Strong", "warn": "Moderate"}.get(self.status_class, "Low")
+
+
+def compute_plan(age_now, age_retire, life_expectancy, infl_pct, monthly_exp,
+                 current_invest=0.0, legacy_goal=0.0) -> Plan:
+    """Evaluate the F17–F26 chain (inheritance excluded from base SIP/Lumpsum)."""
+    # Map inputs -> sheet vars
+    F3, F4, F6 = age_now, age_retire, life_expectancy
+    F5 = max(0, F4 - F3)
+    F7, F8, F9, F10 = infl_pct/100.0, RET_PRE_PCT/100.0, RET_POST_PCT/100.0, RET_EXIST_PCT/100.0
+    F11, F12, F13, F14 = monthly_exp, monthly_exp * 12.0, current_invest, legacy_goal
+
+    F17 = (F9 - F7) / (1.0 + F7)
+    F18 = FV(F7, (F4 - F3), 0.0, -F12, 1)
+
+    F19_base = PV(F17, (F6 - F4), -F18, 0.0, 1)
+    FV_existing_at_ret = FV(F10, (F5), 0.0, -F13, 1)
+    F20_base = F19_base - FV_existing_at_ret
+
+    F21_raw = PMT(F8 / 12.0, (F4 - F3) * 12.0, 0.0, -F20_base, 1)
+    F22_raw = PV(F8, (F4 - F3), 0.0, -F20_base, 1)
+
+    F24 = PV(F9, (F6 - F4), 0.0, -F14, 1)
+    F25 = PMT(F8 / 12.0, (F4 - F3) * 12.0, 0.0, -F24, 1)
+    F26 = PMT(F8, (F4 - F3), 0.0, -F24, 1)
+
+    F19 = F19_base + (F24 if F14 > 0 else 0.0)
+
+    coverage = 0.0 if F19 == 0 else max(0.0, min(1.0, FV_existing_at_ret / F19))
+
+    return Plan(
+        age_now=F3, age_retire=F4, life_expectancy=F6, infl_pct=infl_pct,
+        monthly_exp=F11, current_invest=F13, legacy_goal=F14,
+        F17=F17, F18=F18, F19_base=F19_base, FV_existing_at_ret=FV_existing_at_ret,
+        F20_base=F20_base, F21_raw=F21_raw, F22_raw=F22_raw,
+        F24=F24, F25=F25, F26=F26, F19=F19, coverage=coverage,
+    )
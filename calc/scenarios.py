@@ -0,0 +1,56 @@
+from dataclasses import astuple, dataclass, fields
+from functools import lru_cache
+
+from calc.plan import Plan, compute_plan
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    age_now: int
+    age_retire: int
+    life_expectancy: int
+    infl_pct: float
+    monthly_exp: float
+    current_invest: float = 0.0
+    legacy_goal: float = 0.0
+
+    def inputs(self) -> tuple:
+        return astuple(self)[1:]
+
+    @classmethod
+    def from_plan(cls, name: str, plan: Plan) -> "Scenario":
+        return cls(name, *(getattr(plan, f.name) for f in fields(cls)[1:]))
+
+
+# Shared across sessions: a scenario is only ever computed once per input set.
+@lru_cache(maxsize=4096)
+def cached_plan(*inputs) -> Plan:
+    return compute_plan(*inputs)
+
+def evaluate(scenarios) -> list:
+    """Batch-evaluate scenarios; unchanged ones come straight from the cache."""
+    return [cached_plan(*s.inputs()) for s in scenarios]
+
+
+# (key, label, getter) — the metrics highlighted in the comparison table
+COMPARE_METRICS = (
+    ("corpus", "Corpus at retirement", lambda p: p.F19),
+    ("sip", "Monthly SIP", lambda p: p.total_monthly_sip),
+    ("coverage", "Coverage", lambda p: p.coverage),
+)
+
+def compare(scenarios, baseline: int = 0) -> list:
+    """One dict per scenario with each metric and its delta vs the baseline scenario."""
+    plans = evaluate(scenarios)
+    if not plans:
+        return []
+    base = plans[baseline]
+    rows = []
+    for s, p in zip(scenarios, plans):
+        row = {"name": s.name, "plan": p}
+        for key, _, get in COMPARE_METRICS:
+            row[key] = get(p)
+            row[key + "_delta"] = get(p) - get(base)
+        rows.append(row)
+    return rows
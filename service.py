@@ -0,0 +1,237 @@
+# =========================
+# Standalone JSON calculation service (asyncio, stdlib only)
+# =========================
+# Exposes the same F17–F26 chain as the Streamlit page, for partner pages.
+#
+#   python -m service [--host 127.0.0.1] [--port 8502]
+#
+#   GET  /healthz
+#   POST /v1/plan   {"age_now": 30, "age_retire": 60, ...}        -> {"result": {...}}
+#   POST /v1/plan   [{...}, {...}]                                -> {"results": [...]}
+#   POST /v1/plan   large batch, or Accept: application/x-ndjson   -> one JSON line per item
+#
+# Inputs are validated with the number_input bounds (calc.bounds); missing
+# fields take the widget defaults. Batch items fail individually.
+import argparse
+import asyncio
+import json
+import logging
+import math
+
+from calc import cached_plan, validate_inputs
+
+logger = logging.getLogger(__name__)
+
+STREAM_THRESHOLD = 256      # batches larger than this are streamed as NDJSON
+MAX_BATCH = 100_000
+MAX_BODY = 16 * 1024 * 1024
+MAX_HEADER = 16 * 1024
+
+OUTPUT_FIELDS = (
+    "F17", "F18", "F19_base", "FV_existing_at_ret", "F20_base", "F21_raw", "F22_raw",
+    "F24", "F25", "F26", "F19", "coverage",
+)
+DERIVED_FIELDS = (
+    "F21_display", "F22_display", "gap", "total_monthly_sip", "total_lumpsum",
+    "show_totals", "status_text",
+)
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            411: "Length Required", 413: "Payload Too Large", 500: "Internal Server Error"}
+_dumps = json.JSONEncoder(separators=(",", ":"), allow_nan=False).encode
+
+
+def plan_to_dict(plan) -> dict:
+    out = {k: getattr(plan, k) for k in OUTPUT_FIELDS}
+    for k in DERIVED_FIELDS:
+        out[k] = getattr(plan, k)
+    return out
+
+def evaluate_item(item) -> dict:
+    """{"result": {...}} or {"error": "..."} for one request object."""
+    try:
+        kwargs = validate_inputs(item)
+    except ValueError as e:
+        return {"error": str(e)}
+    try:
+        result = plan_to_dict(cached_plan(*kwargs.values()))
+    except (ArithmeticError, ValueError):
+        result = None
+    # Non-finite results can't be JSON-encoded; fail this item, not the batch.
+    if result is None or not all(math.isfinite(v) for v in result.values() if isinstance(v, float)):
+        return {"error": "calculation failed for these inputs"}
+    return {"result": result}
+
+
+# =========================
+# HTTP plumbing
+# =========================
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+def _response(status: int, body: bytes, keep_alive: bool, ctype: str = "application/json") -> bytes:
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        f"Content-Type: {ctype}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+def _error(status: int, message: str, keep_alive: bool) -> bytes:
+    return _response(status, _dumps({"error": message}).encode(), keep_alive)
+
+async def _read_request(reader, writer):
+    """-> (method, path, headers, body) or None on a clean EOF."""
+    try:
+        raw = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if not e.partial.strip():
+            return None
+        raise HTTPError(400, "truncated request")
+    except asyncio.LimitOverrunError:
+        raise HTTPError(413, "headers too large")
+
+    lines = raw.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "malformed request line")
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            k, _, v = line.partition(":")
+            headers[k.strip().lower()] = v.strip()
+    headers[":version"] = version
+
+    # Chunked request bodies aren't decoded; the error closes the connection,
+    # so the unread chunks are never parsed as a request.
+    if "transfer-encoding" in headers:
+        raise HTTPError(411, "send the body with Content-Length")
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise HTTPError(400, "bad content-length")
+    if length < 0:
+        raise HTTPError(400, "bad content-length")
+    if length > MAX_BODY:
+        raise HTTPError(413, "body too large")
+    if length and headers.get("expect", "").lower() == "100-continue":
+        writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")  # don't make curl wait to upload
+        await writer.drain()
+    body = await reader.readexactly(length) if length else b""
+    return method, target.split("?", 1)[0], headers, body
+
+async def _stream_ndjson(writer, items, keep_alive: bool):
+    writer.write(
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+        b"Transfer-Encoding: chunked\r\n"
+        + (b"Connection: keep-alive\r\n\r\n" if keep_alive else b"Connection: close\r\n\r\n")
+    )
+    chunk = []
+    for i, item in enumerate(items):
+        out = evaluate_item(item)
+        out["index"] = i
+        chunk.append(_dumps(out))
+        if len(chunk) == STREAM_THRESHOLD:
+            data = ("\n".join(chunk) + "\n").encode()
+            writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+            chunk = []
+            await writer.drain()
+    if chunk:
+        data = ("\n".join(chunk) + "\n").encode()
+        writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+    writer.write(b"0\r\n\r\n")
+
+async def _handle_plan(writer, headers, body, keep_alive: bool):
+    try:
+        payload = json.loads(body or b"null")
+    except ValueError:
+        raise HTTPError(400, "invalid JSON")
+
+    if isinstance(payload, dict):
+        out = evaluate_item(payload)
+        writer.write(_response(400 if "error" in out else 200, _dumps(out).encode(), keep_alive))
+        return
+    if not isinstance(payload, list):
+        raise HTTPError(400, "expected a JSON object or array")
+    if len(payload) > MAX_BATCH:
+        raise HTTPError(413, f"batch larger than {MAX_BATCH}")
+
+    wants_stream = len(payload) > STREAM_THRESHOLD or "ndjson" in headers.get("accept", "")
+    if wants_stream and headers[":version"] == "HTTP/1.1":
+        await _stream_ndjson(writer, payload, keep_alive)
+    elif wants_stream:  # no chunked encoding before HTTP/1.1: same NDJSON, buffered
+        lines = []
+        for i, item in enumerate(payload):
+            out = evaluate_item(item)
+            out["index"] = i
+            lines.append(_dumps(out))
+        body = ("\n".join(lines) + "\n").encode()
+        writer.write(_response(200, body, keep_alive, ctype="application/x-ndjson"))
+    else:
+        body = _dumps({"results": [evaluate_item(item) for item in payload]}).encode()
+        writer.write(_response(200, body, keep_alive))
+
+async def handle_connection(reader, writer):
+    try:
+        while True:
+            keep_alive = False
+            try:
+                req = await _read_request(reader, writer)
+                if req is None:
+                    break
+                method, path, headers, body = req
+                conn = headers.get("connection", "").lower()
+                keep_alive = conn != "close" if headers[":version"] == "HTTP/1.1" else conn == "keep-alive"
+
+                if path == "/healthz":
+                    writer.write(_response(200, b'{"ok":true}', keep_alive))
+                elif path == "/v1/plan":
+                    if method != "POST":
+                        raise HTTPError(405, "use POST")
+                    await _handle_plan(writer, headers, body, keep_alive)
+                else:
+                    raise HTTPError(404, "not found")
+            except HTTPError as e:
+                writer.write(_error(e.status, str(e), keep_alive))
+            except (ConnectionError, asyncio.IncompleteReadError):
+                raise
+            except Exception:
+                logger.exception("unhandled error while serving request")
+                writer.write(_error(500, "internal error", False))
+                keep_alive = False
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8502, **kwargs):
+    return await asyncio.start_server(handle_connection, host, port, limit=MAX_HEADER, **kwargs)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Retirement calculation JSON service")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8502)
+    args = ap.parse_args(argv)
+
+    async def run():
+        server = await serve(args.host, args.port)
+        print(f"listening on http://{args.host}:{args.port}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
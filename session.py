@@ -0,0 +1,46 @@
+# =========================
+# Per-session state
+# =========================
+# One slots-based object under a single session_state key instead of ~20
+# loose keys, each with its own `if ... not in st.session_state` check.
+# Widget-bound keys (si_first_name, cta_submit, ...) stay in session_state
+# because Streamlit owns them. No Streamlit import, so this stays testable.
+from dataclasses import dataclass
+
+SESSION_KEY = "_session"
+
+
+@dataclass(slots=True)
+class SessionModel:
+    # Sign-in
+    signed_in: bool = False
+    user_first_name: str = ""
+    user_last_name: str = ""
+    user_email: str = ""
+    user_phone: str = ""
+    # Previous KPI values (CountUp start points)
+    prev_F19: int = 0
+    prev_F21: int = 0
+    prev_F22: int = 0
+    prev_F25: int = 0
+    prev_F26: int = 0
+    prev_total_monthly: int = 0
+    prev_total_lumpsum: int = 0
+    prev_snap_fv: int = 0
+    prev_snap_gap: int = 0
+    prev_show_totals: bool = False
+    # Save CTA (anti-spam cooldown)
+    saving: bool = False
+    last_save_time: float = 0.0
+    # Scenario workspace (storage.Workspace), loaded on first render, and the
+    # random id it is stored under (also kept in the URL so a reload finds it)
+    workspace: object = None
+    workspace_id: str = ""
+
+
+def get_session(state) -> SessionModel:
+    """Single initialization path: fetch or create the session model."""
+    model = state.get(SESSION_KEY)
+    if model is None:
+        model = state[SESSION_KEY] = SessionModel()
+    return model
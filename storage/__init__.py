@@ -0,0 +1,14 @@
+"""Google Sheets persistence. gspread / google-auth / pytz load on first write."""
+from storage.schema import SNAPSHOT, Column, SnapshotSchema, snapshot_record
+from storage.sheets import (
+    SCOPES, TS_FORMAT, get_ws, now_ist, signin_row, column_map,
+    append_signin, append_snapshot, append_snapshots,
+)
+from storage.workspace import Workspace, is_workspace_id, new_workspace_id, workspace_path
+
+__all__ = [
+    "SNAPSHOT", "Column", "SnapshotSchema", "snapshot_record",
+    "SCOPES", "TS_FORMAT", "get_ws", "now_ist", "signin_row", "column_map",
+    "append_signin", "append_snapshot", "append_snapshots",
+    "Workspace", "is_workspace_id", "new_workspace_id", "workspace_path",
+]
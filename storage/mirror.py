@@ -0,0 +1,191 @@
+# =========================
+# Local SQLite mirror of the Leads sheet (analytics)
+# =========================
+# The worksheet mixes two row shapes:
+#   SIGNIN    -> ts, first, last, email, phone, "SIGNIN"
+#   snapshot  -> the storage.schema.SNAPSHOT columns (22 legacy + scenario/version),
+#                located through the header row when the sheet has one
+# sync() reads only rows below the last synced row, several ranges per API
+# call, and splits them into typed `signins` / `snapshots` tables keyed by
+# sheet row number, so re-running a sync is idempotent. The first write to a
+# legacy headerless sheet inserts a header row (storage.sheets.column_map),
+# shifting every row down by one: rebuild a mirror made before that.
+#
+# `ws` only needs gspread's Worksheet.batch_get(ranges, **kwargs) returning
+# one list-of-rows per range, which makes a fake worksheet trivial.
+#
+#   python -m storage.mirror leads.sqlite [--secrets .streamlit/secrets.toml]
+import sqlite3
+
+from storage.schema import SNAPSHOT
+from storage.sheets import col_letter
+
+SIGNIN_COLUMNS = [
+    ("ts", "TEXT"), ("first_name", "TEXT"), ("last_name", "TEXT"),
+    ("email", "TEXT"), ("phone", "TEXT"),
+]
+
+# Snapshot columns come from the versioned schema (storage.schema).
+_SQL_TYPES = {str: "TEXT", int: "INTEGER", float: "REAL"}
+SNAPSHOT_COLUMNS = [(c.name, _SQL_TYPES[c.kind]) for c in SNAPSHOT.columns]
+
+LAST_COL = col_letter(len(SNAPSHOT_COLUMNS) - 1)
+HEADER_COL = "ZZ"
+HEADER_RANGE = f"A1:{HEADER_COL}1"
+_CASTS = {"TEXT": str, "INTEGER": lambda v: int(float(v)), "REAL": float}
+
+
+def _ddl(table, columns):
+    cols = ", ".join(f"{name} {typ}" for name, typ in columns)
+    return f"CREATE TABLE IF NOT EXISTS {table} (sheet_row INTEGER PRIMARY KEY, {cols})"
+
+def connect(path=":memory:") -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute(_ddl("signins", SIGNIN_COLUMNS))
+    conn.execute(_ddl("snapshots", SNAPSHOT_COLUMNS))
+    have = {r[1] for r in conn.execute("PRAGMA table_info(snapshots)")}
+    for name, typ in SNAPSHOT_COLUMNS:  # schema grew since the mirror was created
+        if name not in have:
+            conn.execute(f"ALTER TABLE snapshots ADD COLUMN {name} {typ}")
+    conn.execute("CREATE INDEX IF NOT EXISTS snapshots_email ON snapshots (email)")
+    conn.execute("CREATE INDEX IF NOT EXISTS snapshots_ts ON snapshots (ts)")
+    conn.execute("CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value INTEGER)")
+    conn.commit()
+    return conn
+
+def last_synced_row(conn) -> int:
+    r = conn.execute("SELECT value FROM sync_state WHERE key = 'last_row'").fetchone()
+    return r[0] if r else 0
+
+def _typed(row, columns):
+    row = list(row) + [""] * (len(columns) - len(row))
+    return [None if v == "" and typ != "TEXT" else _CASTS[typ](v) for v, (_, typ) in zip(row, columns)]
+
+def classify(row, mapping=None):
+    """-> ("signin" | "snapshot", typed values) or (None, None) for headers/junk.
+
+    SIGNIN rows are always positional (append_signin). Snapshot cells are
+    picked through `mapping` (schema column -> sheet column, from the header);
+    None means the legacy positional layout.
+    """
+    if len(row) >= 6 and str(row[5]).strip().upper() == "SIGNIN":
+        return "signin", _typed(row[:5], SIGNIN_COLUMNS)
+    if mapping is not None:
+        row = [row[i] if i < len(row) else "" for i in mapping]
+    while row and row[-1] == "":
+        row = row[:-1]
+    if len(row) >= SNAPSHOT.required_count:
+        try:
+            return "snapshot", _typed(row[:len(SNAPSHOT_COLUMNS)], SNAPSHOT_COLUMNS)
+        except (TypeError, ValueError):
+            pass
+    return None, None
+
+def _insert_sql(table, columns):
+    names = ", ".join(["sheet_row"] + [n for n, _ in columns])
+    marks = ", ".join("?" * (len(columns) + 1))
+    return f"INSERT OR REPLACE INTO {table} ({names}) VALUES ({marks})"
+
+def sync(conn, ws, batch_rows: int = 1000, ranges_per_call: int = 5) -> dict:
+    """Pull rows added since the last sync into the mirror. Returns counts."""
+    start = last_synced_row(conn) + 1
+    counts = {"signins": 0, "snapshots": 0, "skipped": 0, "calls": 0}
+    sql = {"signin": _insert_sql("signins", SIGNIN_COLUMNS),
+           "snapshot": _insert_sql("snapshots", SNAPSHOT_COLUMNS)}
+
+    # The header row rides along with the first read; it decides where each
+    # snapshot column lives (same rules as storage.sheets.column_map).
+    mapping, last_col = None, LAST_COL
+    done = False
+    while not done:
+        bounds = [(start + i * batch_rows, start + (i + 1) * batch_rows - 1) for i in range(ranges_per_call)]
+        header_range = [HEADER_RANGE] if counts["calls"] == 0 else []
+        # Until the header is known, read as wide as the header scan (Sheets
+        # returns no trailing empty cells, so this costs nothing extra).
+        width = HEADER_COL if header_range else last_col
+        ranges = header_range + [f"A{a}:{width}{b}" for a, b in bounds]
+        results = ws.batch_get(
+            ranges,
+            value_render_option="UNFORMATTED_VALUE",
+            date_time_render_option="FORMATTED_STRING",
+        )
+        counts["calls"] += 1
+        if header_range:
+            header, results = results[0], results[1:]
+            layout, _ = SNAPSHOT.layout([str(v) for v in (header[0] if header else [])])
+            if layout != tuple(range(len(SNAPSHOT_COLUMNS))):
+                mapping = layout
+            last_col = col_letter(max(max(layout), 5))
+
+        last_row = start - 1
+        for (a, b), values in zip(bounds, results):
+            for offset, row in enumerate(values):
+                if not any(str(v).strip() for v in row):
+                    continue
+                kind, typed = classify(row, mapping)
+                if kind is None:
+                    counts["skipped"] += 1
+                    continue
+                conn.execute(sql[kind], [a + offset] + typed)
+                counts[kind + "s"] += 1
+            if values:
+                last_row = a + len(values) - 1
+            if len(values) < b - a + 1:  # short read -> reached the end of the data
+                done = True
+                break
+
+        conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES ('last_row', ?)", (last_row,))
+        conn.commit()
+        start = last_row + 1
+
+    return counts
+
+# =========================
+# Analytics helpers
+# =========================
+# Scenario sync writes "what-if" rows (non-empty `scenario`) into the same
+# sheet; only real saves count as a user's plan.
+_SAVED = "(scenario IS NULL OR scenario = '')"
+
+def latest_snapshots(conn):
+    """Most recent saved (non-scenario) snapshot per email."""
+    return conn.execute(
+        "SELECT s.* FROM snapshots s JOIN ("
+        f" SELECT email, MAX(sheet_row) AS r FROM snapshots WHERE {_SAVED} GROUP BY email"
+        ") l ON s.sheet_row = l.r ORDER BY s.sheet_row"
+    ).fetchall()
+
+def plan_distribution(conn, column: str = "sip", bucket: float = 10_000.0):
+    """Histogram of latest-per-user saved snapshots for one numeric column."""
+    if column not in {n for n, t in SNAPSHOT_COLUMNS if t != "TEXT"}:
+        raise ValueError(f"Unknown numeric column: {column}")
+    return conn.execute(
+        f"SELECT CAST({column} / ? AS INTEGER) * ? AS bucket, COUNT(*) FROM snapshots"
+        f" WHERE sheet_row IN (SELECT MAX(sheet_row) FROM snapshots WHERE {_SAVED} GROUP BY email)"
+        " GROUP BY bucket ORDER BY bucket",
+        (bucket, bucket),
+    ).fetchall()
+
+
+def _main(argv=None):
+    import argparse
+    import tomllib
+
+    from storage.sheets import get_ws
+
+    ap = argparse.ArgumentParser(description="Incrementally sync the Leads sheet into SQLite.")
+    ap.add_argument("db")
+    ap.add_argument("--secrets", default=".streamlit/secrets.toml")
+    args = ap.parse_args(argv)
+
+    with open(args.secrets, "rb") as f:
+        secrets = tomllib.load(f)
+    conn = connect(args.db)
+    counts = sync(conn, get_ws(secrets))
+    print(f"synced up to row {last_synced_row(conn)}: "
+          f"{counts['signins']} sign-ins, {counts['snapshots']} snapshots, "
+          f"{counts['skipped']} skipped in {counts['calls']} call(s)")
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,119 @@
+# =========================
+# Versioned snapshot schema
+# =========================
+# Replaces the positional 22-element `row` list. Columns are named and
+# typed; the first 22 keep the legacy order so headerless sheets (and the
+# mirror) still line up. Values are cast here so they can be written RAW.
+from dataclasses import dataclass
+
+from calc.plan import RET_EXIST_PCT
+
+
+@dataclass(frozen=True)
+class Column:
+    name: str
+    kind: type              # str | int | float
+    required: bool = True
+
+
+@dataclass(frozen=True)
+class SnapshotSchema:
+    version: int
+    columns: tuple
+
+    @property
+    def names(self) -> list:
+        return [c.name for c in self.columns]
+
+    @property
+    def required_count(self) -> int:
+        return sum(c.required for c in self.columns)
+
+    def header(self) -> list:
+        return self.names
+
+    def serialize(self, record: dict) -> dict:
+        """Cast a record to the column types; unknown keys are an error."""
+        unknown = set(record) - set(self.names)
+        if unknown:
+            raise ValueError(f"Unknown snapshot fields: {', '.join(sorted(unknown))}")
+        out = {}
+        for c in self.columns:
+            if c.name == "schema_version":
+                out[c.name] = self.version
+            elif c.name in record:
+                out[c.name] = c.kind(record[c.name])
+            elif c.required:
+                raise ValueError(f"Missing snapshot field: {c.name}")
+            else:
+                out[c.name] = c.kind()
+        return out
+
+    def is_header(self, row: list) -> bool:
+        """A header names several schema columns (anywhere, any order); a
+        legacy data row in row 1 won't."""
+        return len({str(h).strip() for h in row} & set(self.names)) >= 3
+
+    def layout(self, header: list) -> tuple:
+        """-> (sheet column index per schema column, header cells to add).
+
+        An empty or legacy (headerless) first row maps positionally. A real
+        header maps by name; schema columns it lacks are added at the end.
+        """
+        header = [str(h).strip() for h in header]
+        if not any(header):
+            return tuple(range(len(self.columns))), list(enumerate(self.names))
+        if not self.is_header(header):  # legacy sheet: data starts in row 1
+            return tuple(range(len(self.columns))), []
+        index = {h: i for i, h in enumerate(header) if h}
+        mapping, added = [], []
+        for name in self.names:
+            if name not in index:
+                index[name] = len(header) + len(added)
+                added.append((index[name], name))
+            mapping.append(index[name])
+        return tuple(mapping), added
+
+    def to_row(self, record: dict, mapping: tuple) -> list:
+        values = self.serialize(record)
+        row = [""] * (max(mapping) + 1)
+        for name, col in zip(self.names, mapping):
+            row[col] = values[name]
+        return row
+
+
+SNAPSHOT = SnapshotSchema(version=2, columns=(
+    Column("ts", str), Column("first_name", str), Column("last_name", str),
+    Column("email", str), Column("phone", str),
+    Column("age_now", int), Column("age_retire", int), Column("life_expectancy", int),
+    Column("infl_pct", float), Column("ret_exist_pct", float),
+    Column("monthly_exp", float), Column("yearly_exp", float),
+    Column("current_invest", float), Column("legacy_goal", float),
+    Column("corpus", float), Column("fv_existing", float), Column("gap", float),
+    Column("sip", float), Column("lumpsum", float), Column("add_sip", float), Column("add_lumpsum", float),
+    Column("coverage_pct", float),
+    # v2
+    Column("scenario", str, required=False),
+    Column("schema_version", int, required=False),
+))
+
+
+def snapshot_record(ts: str, user: tuple, plan, ret_exist_pct: float = RET_EXIST_PCT, scenario: str = "") -> dict:
+    """Snapshot fields for one plan; `user` is (first, last, email, phone)."""
+    first, last, email, phone = user
+    return {
+        "ts": ts, "first_name": first, "last_name": last, "email": email, "phone": phone,
+        "age_now": plan.age_now, "age_retire": plan.age_retire, "life_expectancy": plan.life_expectancy,
+        "infl_pct": plan.infl_pct, "ret_exist_pct": ret_exist_pct,
+        "monthly_exp": plan.monthly_exp, "yearly_exp": plan.yearly_exp,
+        "current_invest": plan.current_invest, "legacy_goal": plan.legacy_goal,
+        "corpus": plan.F19,
+        "fv_existing": plan.FV_existing_at_ret,
+        "gap": max(plan.F20_base, 0.0),
+        "sip": plan.F21_display,
+        "lumpsum": plan.F22_display,
+        "add_sip": max(plan.F25, 0.0),
+        "add_lumpsum": max(plan.F26, 0.0),
+        "coverage_pct": round(plan.coverage * 100.0, 1),
+        "scenario": scenario,
+    }
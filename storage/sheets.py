@@ -0,0 +1,101 @@
+# =========================
+# Google Sheets helpers
+# =========================
+# Heavy client libraries are imported inside the functions so that a cold
+# process only pays for them the first time a row is actually written.
+
+from storage.schema import SNAPSHOT
+
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+]
+
+def get_ws(secrets):
+    """Open the Leads worksheet using a Streamlit-style secrets mapping."""
+    import gspread
+    from google.oauth2.service_account import Credentials
+
+    sa_info = secrets["gcp_service_account"]
+    creds = Credentials.from_service_account_info(sa_info, scopes=SCOPES)
+    gc = gspread.authorize(creds)
+    sheet_url = secrets["gsheets"]["sheet_url"]
+    ws_name   = secrets["gsheets"].get("worksheet", "Leads")
+    sh = gc.open_by_url(sheet_url)
+    return sh.worksheet(ws_name)
+
+# Column A timestamps (sign-ins and snapshots alike) are written RAW as text in
+# this format, IST. Rows written before the RAW switch hold Sheets date
+# values; read with date_time_render_option="FORMATTED_STRING" (as the
+# mirror does) both come back as the same text.
+TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def now_ist() -> str:
+    import pytz
+    from datetime import datetime
+
+    ist = pytz.timezone("Asia/Kolkata")
+    return datetime.now(ist).strftime(TS_FORMAT)
+
+def signin_row(first_name: str, last_name: str, email: str, phone: str) -> list:
+    return [now_ist(), first_name.strip(), last_name.strip(), email.strip(), phone.strip(), "SIGNIN"]
+
+def append_signin(ws, first_name: str, last_name: str, email: str, phone: str):
+    # Sign-in is the first write on a fresh sheet; settle the header before it.
+    column_map(ws)
+    ws.append_row(signin_row(first_name, last_name, email, phone), value_input_option="RAW")
+
+# Column mapping per worksheet, resolved from the header row once per process.
+_COLUMN_MAPS = {}
+
+def col_letter(n: int) -> str:
+    """0-based column index -> A1 letters."""
+    out = ""
+    n += 1
+    while n:
+        n, r = divmod(n - 1, 26)
+        out = chr(65 + r) + out
+    return out
+
+def _ws_key(ws) -> tuple:
+    return (getattr(ws, "spreadsheet_id", None), getattr(ws, "id", None), ws.title)
+
+def column_map(ws, schema=SNAPSHOT) -> tuple:
+    """Check the header row once; add missing schema columns; cache the mapping.
+
+    A legacy headerless sheet gets the header inserted above its data: those
+    rows are positional, so the schema header names them as they stand.
+    """
+    key = (_ws_key(ws), schema.version)
+    mapping = _COLUMN_MAPS.get(key)
+    if mapping is None:
+        header = ws.row_values(1)
+        if any(str(h).strip() for h in header) and not schema.is_header(header):
+            ws.insert_row(schema.header(), index=1, value_input_option="RAW")
+            header = schema.header()
+        mapping, added = schema.layout(header)
+        if added:
+            first, last = added[0][0], added[-1][0]
+            cells = [""] * (last - first + 1)
+            for col, name in added:
+                cells[col - first] = name
+            ws.update(range_name=f"{col_letter(first)}1:{col_letter(last)}1",
+                      values=[cells], value_input_option="RAW")
+        _COLUMN_MAPS[key] = mapping
+    return mapping
+
+def append_snapshots(ws, records: list, schema=SNAPSHOT):
+    """Write snapshot records as typed RAW values, all rows in one API call.
+
+    The append endpoint (not a positional range update) is used so concurrent
+    sessions can never claim the same row.
+    """
+    if not records:
+        return
+    mapping = column_map(ws, schema)
+    rows = [schema.to_row(r, mapping) for r in records]
+    ws.append_rows(rows, value_input_option="RAW", insert_data_option="INSERT_ROWS",
+                   table_range=f"A1:{col_letter(max(mapping))}1")
+
+def append_snapshot(ws, record: dict, schema=SNAPSHOT):
+    append_snapshots(ws, [record], schema)
@@ -0,0 +1,117 @@
+# =========================
+# Scenario workspace (local JSON, batched sheet sync)
+# =========================
+# Workspaces are keyed by a random per-browser id (new_workspace_id), never
+# by the unauthenticated sign-in email. json/hashlib/secrets are imported on
+# use, like the Sheets clients in sheets.py.
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+
+from calc.bounds import validate_inputs
+from calc.scenarios import Scenario
+
+WORKSPACE_DIR = ".workspaces"
+WORKSPACE_ID_LEN = 32   # hex chars
+
+# Sessions are threads of one Streamlit process; a save's load-merge-write
+# must not interleave with another's.
+_SAVE_LOCK = threading.Lock()
+
+
+def new_workspace_id() -> str:
+    import secrets
+
+    return secrets.token_hex(WORKSPACE_ID_LEN // 2)
+
+def is_workspace_id(value) -> bool:
+    return (isinstance(value, str) and len(value) == WORKSPACE_ID_LEN
+            and all(c in "0123456789abcdef" for c in value))
+
+def workspace_path(workspace_id: str, root: str = WORKSPACE_DIR) -> str:
+    import hashlib
+
+    key = hashlib.sha1(workspace_id.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(root, f"{key}.json")
+
+
+def _scenario(d):
+    """Scenario from a stored dict, or None if the entry is stale or malformed."""
+    if not isinstance(d, dict) or not isinstance(d.get("name"), str):
+        return None
+    try:
+        return Scenario(d["name"], **validate_inputs({k: v for k, v in d.items() if k != "name"}))
+    except ValueError:
+        return None
+
+
+@dataclass
+class Workspace:
+    scenarios: list = field(default_factory=list)
+    synced: set = field(default_factory=set)  # Scenario values already written to the sheet
+    removed: set = field(default_factory=set)  # names dropped since the last save
+    seen: set = field(default_factory=set)     # scenarios as of the last load/save
+
+    def names(self) -> list:
+        return [s.name for s in self.scenarios]
+
+    def put(self, scenario: Scenario):
+        """Add a scenario, replacing any existing one with the same name."""
+        self.removed.discard(scenario.name)
+        for i, s in enumerate(self.scenarios):
+            if s.name == scenario.name:
+                self.scenarios[i] = scenario
+                return
+        self.scenarios.append(scenario)
+
+    def remove(self, name: str):
+        self.scenarios = [s for s in self.scenarios if s.name != name]
+        self.removed.add(name)
+
+    def pending(self) -> list:
+        return [s for s in self.scenarios if s not in self.synced]
+
+    def mark_synced(self, scenarios):
+        self.synced.update(scenarios)
+
+    # --- local persistence ---
+    @classmethod
+    def load(cls, path: str) -> "Workspace":
+        import json
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        if not isinstance(data, dict):
+            return cls()
+        scenarios = [s for s in map(_scenario, data.get("scenarios") or []) if s]
+        synced = {s for s in map(_scenario, data.get("synced") or []) if s}
+        return cls(scenarios=scenarios, synced=synced, seen=set(scenarios))
+
+    def merge(self, other: "Workspace"):
+        """Take in what another session saved; this one's edits win."""
+        theirs = {s.name for s in other.scenarios}
+        # Unchanged here and gone there: the other session removed it.
+        self.scenarios = [s for s in self.scenarios if s.name in theirs or s not in self.seen]
+        names = set(self.names())
+        self.scenarios += [s for s in other.scenarios if s.name not in names | self.removed]
+        self.synced |= other.synced
+
+    def save(self, path: str):
+        """Merge what is on disk (another tab may have saved), then write."""
+        import json
+
+        with _SAVE_LOCK:
+            self.merge(type(self).load(path))
+            self.removed.clear()
+            self.seen = set(self.scenarios)
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({
+                    "scenarios": [asdict(s) for s in self.scenarios],
+                    "synced": [asdict(s) for s in self.synced if s in self.scenarios],
+                }, f, indent=1)
+            os.replace(tmp, path)
@@ -0,0 +1,60 @@
+import re
+
+
+def _rowcol(a1):
+    """'C7' -> (row, 0-based col); a bare column ('C') has row None."""
+    m = re.fullmatch(r"([A-Z]+)(\d*)", a1)
+    col = 0
+    for ch in m.group(1):
+        col = col * 26 + ord(ch) - 64
+    return (int(m.group(2)) if m.group(2) else None), col - 1
+
+
+class FakeWorksheet:
+    """In-memory stand-in for the bits of gspread.Worksheet the app uses."""
+
+    def __init__(self, rows=None, title="Leads"):
+        self.rows = [list(r) for r in rows or []]
+        self.title = title
+        self.id = 0
+        self.spreadsheet_id = "fake"
+        self.calls = []
+
+    def batch_get(self, ranges, **kwargs):
+        self.calls.append(("batch_get", list(ranges), kwargs))
+        out = []
+        for r in ranges:
+            (a, c0), (b, c1) = (_rowcol(x) for x in r.split(":"))
+            values = [row[c0:c1 + 1] for row in self.rows[a - 1:b]]
+            while values and not any(v != "" for v in values[-1]):  # Sheets trims trailing blanks
+                values.pop()
+            out.append(values)
+        return out
+
+    def row_values(self, n):
+        self.calls.append(("row_values", n))
+        row = self.rows[n - 1] if len(self.rows) >= n else []
+        while row and row[-1] == "":
+            row = row[:-1]
+        return list(row)
+
+    def update(self, range_name=None, values=None, value_input_option=None):
+        self.calls.append(("update", range_name, values, value_input_option))
+        (r, c), _ = (_rowcol(x) for x in range_name.split(":"))
+        for dr, vals in enumerate(values):
+            while len(self.rows) < r + dr:
+                self.rows.append([])
+            row = self.rows[r + dr - 1]
+            row.extend([""] * (c + len(vals) - len(row)))
+            row[c:c + len(vals)] = vals
+
+    def insert_row(self, values, index=1, **kwargs):
+        self.calls.append(("insert_row", list(values), index, kwargs))
+        self.rows.insert(index - 1, list(values))
+
+    def append_row(self, values, **kwargs):
+        self.append_rows([values], **kwargs)
+
+    def append_rows(self, values, **kwargs):
+        self.calls.append(("append_rows", [list(v) for v in values], kwargs))
+        self.rows.extend(list(v) for v in values)
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from calc import bounds, validate_inputs
+
+
+def test_defaults_match_widget_defaults():
+    assert validate_inputs({}) == {
+        "age_now": 25, "age_retire": 60, "life_expectancy": 90, "infl_pct": 5.0,
+        "monthly_exp": 50_000.0, "current_invest": 0.0, "legacy_goal": 0.0,
+    }
+
+
+@pytest.mark.parametrize("age_now, expected", [(16, (17, 90)), (80, (81, 90)), (89, (90, 90)), (95, (96, 96))])
+def test_retire_age_bounds_match_widget(age_now, expected):
+    # ui.py used: min = age_now + 1, max = max(min, 90)
+    assert bounds.retire_age_bounds(age_now) == expected
+
+
+@pytest.mark.parametrize("age_retire, expected", [(60, (61, 110)), (109, (110, 110)), (115, (116, 116))])
+def test_life_expectancy_bounds_match_widget(age_retire, expected):
+    # ui.py used: min = max(0, age_retire + 1), max = max(min, 110)
+    assert bounds.life_expectancy_bounds(age_retire) == expected
+
+
+@pytest.mark.parametrize("field, lo, hi", [
+    ("infl_pct", 0.0, 20.0),
+    ("monthly_exp", 0.0, 5_000_000.0),
+    ("current_invest", 0.0, 1_000_000_000.0),
+    ("legacy_goal", 0.0, 1_000_000_000.0),
+])
+def test_float_bounds_edges(field, lo, hi):
+    assert validate_inputs({field: lo})[field] == lo
+    assert validate_inputs({field: hi})[field] == hi
+    with pytest.raises(ValueError, match=field):
+        validate_inputs({field: hi * 1.0001 + 1})
+    with pytest.raises(ValueError, match=field):
+        validate_inputs({field: lo - 1})
+
+
+def test_age_edges():
+    assert validate_inputs({"age_now": 16, "age_retire": 17, "life_expectancy": 18})["age_now"] == 16
+    assert validate_inputs({"age_now": 80, "age_retire": 90, "life_expectancy": 110})["age_retire"] == 90
+    for bad in ({"age_now": 15}, {"age_now": 81},
+                {"age_now": 30, "age_retire": 30}, {"age_now": 30, "age_retire": 91},
+                {"age_retire": 60, "life_expectancy": 60}, {"life_expectancy": 111}):
+        with pytest.raises(ValueError):
+            validate_inputs(bad)
+
+
+def test_integral_floats_are_accepted_for_ages():
+    assert validate_inputs({"age_now": 30.0})["age_now"] == 30
+
+
+@pytest.mark.parametrize("raw, message", [
+    ('{"age_now": 1e400}', "age_now: expected an integer"),
+    ('{"age_now": NaN}', "age_now: expected an integer"),
+    ('{"age_now": 30.5}', "age_now: expected an integer"),
+    ('{"age_now": true}', "age_now: expected an integer"),
+    ('{"age_now": "30"}', "age_now: expected an integer"),
+    ('{"monthly_exp": 1' + "0" * 400 + "}", "monthly_exp: expected a number"),
+    ('{"monthly_exp": -Infinity}', "monthly_exp: expected a number"),
+    ('{"infl_pct": null}', "infl_pct: expected a number"),
+])
+def test_malformed_numbers_are_field_errors(raw, message):
+    with pytest.raises(ValueError) as exc:
+        validate_inputs(json.loads(raw))
+    assert message in str(exc.value)
+
+
+def test_huge_integer_age_is_a_range_error():
+    with pytest.raises(ValueError, match=r"age_now: value not in \[16, 80\]"):
+        validate_inputs({"age_now": 10 ** 300})
+
+
+def test_unknown_fields_and_non_objects():
+    with pytest.raises(ValueError, match="bogus: unknown field"):
+        validate_inputs({"bogus": 1})
+    with pytest.raises(ValueError, match="expected a JSON object"):
+        validate_inputs([1, 2])
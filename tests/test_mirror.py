@@ -0,0 +1,127 @@
+import pytest
+from fakes import FakeWorksheet
+
+import storage
+from calc import compute_plan
+from storage import mirror
+
+
+def signin(i):
+    return [f"2025-01-01 10:00:{i % 60:02d}", f"First{i}", f"Last{i}", f"u{i}@x.com", "98", "SIGNIN"]
+
+def snapshot(i, email=None, sip=10_000.0):
+    return [f"2025-01-02 10:00:{i % 60:02d}", f"First{i}", f"Last{i}", email or f"u{i}@x.com", "98",
+            30, 60, 90, 5.0, 12.0, 50_000.0, 600_000.0, 0.0, 0.0,
+            1e7, 0.0, 1e7, sip, 2e5, 0.0, 0.0, 0.0]
+
+
+def test_mixed_rows_land_in_typed_tables():
+    ws = FakeWorksheet([["Timestamp", "First", "Last", "Email", "Phone", "Kind"], signin(1), snapshot(2), signin(3)])
+    conn = mirror.connect()
+    counts = mirror.sync(conn, ws)
+    assert counts == {"signins": 2, "snapshots": 1, "skipped": 1, "calls": 1}
+
+    assert conn.execute("SELECT sheet_row, email FROM signins ORDER BY sheet_row").fetchall() == [
+        (2, "u1@x.com"), (4, "u3@x.com")]
+    row = conn.execute("SELECT sheet_row, age_now, sip, coverage_pct FROM snapshots").fetchone()
+    assert row == (3, 30, 10_000.0, 0.0)
+    assert isinstance(row[1], int) and isinstance(row[2], float)
+
+def test_junk_row_is_skipped_not_fatal():
+    ws = FakeWorksheet([signin(1), ["oops", "", "", "", "", 7, "not-a-number"], snapshot(3)])
+    counts = mirror.sync(mirror.connect(), ws)
+    assert (counts["signins"], counts["snapshots"], counts["skipped"]) == (1, 1, 1)
+
+def test_second_sync_fetches_only_new_rows():
+    ws = FakeWorksheet([signin(i) for i in range(1, 11)])
+    conn = mirror.connect()
+    mirror.sync(conn, ws, batch_rows=4, ranges_per_call=2)
+    assert mirror.last_synced_row(conn) == 10
+
+    ws.rows += [snapshot(11), signin(12)]
+    ws.calls.clear()
+    counts = mirror.sync(conn, ws, batch_rows=4, ranges_per_call=2)
+    assert counts == {"signins": 1, "snapshots": 1, "skipped": 0, "calls": 1}
+    assert len(ws.calls) == 1
+    ranges = ws.calls[0][1]
+    assert ranges[0] == mirror.HEADER_RANGE  # header rides along, no extra call
+    assert ranges[1].startswith("A11:")  # data starts right after the last synced row
+    assert ws.calls[0][2]["value_render_option"] == "UNFORMATTED_VALUE"
+
+def test_full_ranges_keep_reading_until_short_read():
+    ws = FakeWorksheet([signin(i) for i in range(1, 21)])  # exactly 20 rows
+    conn = mirror.connect()
+    counts = mirror.sync(conn, ws, batch_rows=5, ranges_per_call=2)
+    # 2 full calls (rows 1-10, 11-20), then a third that comes back empty and stops
+    assert counts["calls"] == 3
+    assert counts["signins"] == 20
+    assert mirror.last_synced_row(conn) == 20
+
+def test_short_read_stops_within_a_call():
+    ws = FakeWorksheet([signin(i) for i in range(1, 8)])
+    counts = mirror.sync(mirror.connect(), ws, batch_rows=5, ranges_per_call=4)
+    assert counts["calls"] == 1
+
+def test_resync_is_idempotent(tmp_path):
+    ws = FakeWorksheet([signin(1), snapshot(2), snapshot(3)])
+    db = str(tmp_path / "leads.sqlite")
+    mirror.sync(mirror.connect(db), ws)
+    conn = mirror.connect(db)
+    assert mirror.sync(conn, ws)["snapshots"] == 0
+    # Even a forced full re-read replaces rows by sheet_row instead of duplicating them.
+    conn.execute("DELETE FROM sync_state")
+    mirror.sync(conn, ws)
+    assert conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0] == 2
+    assert conn.execute("SELECT COUNT(*) FROM signins").fetchone()[0] == 1
+
+def test_analytics_helpers():
+    ws = FakeWorksheet([snapshot(1, "a@x.com", 5_000.0), snapshot(2, "a@x.com", 25_000.0),
+                        snapshot(3, "b@x.com", 26_000.0)])
+    conn = mirror.connect()
+    mirror.sync(conn, ws)
+    assert [r[0] for r in mirror.latest_snapshots(conn)] == [2, 3]
+    assert mirror.plan_distribution(conn, "sip", 10_000.0) == [(20_000.0, 2)]
+
+def test_scenario_rows_are_excluded_from_analytics():
+    ws = FakeWorksheet([snapshot(1, "a@x.com", 5_000.0),
+                        snapshot(2, "a@x.com", 95_000.0) + ["what-if", 2],
+                        snapshot(3, "b@x.com", 5_000.0) + ["", 2]])
+    conn = mirror.connect()
+    assert mirror.sync(conn, ws)["snapshots"] == 3
+    assert [r[0] for r in mirror.latest_snapshots(conn)] == [1, 3]
+    assert mirror.plan_distribution(conn, "sip", 10_000.0) == [(0.0, 2)]
+
+
+def test_snapshot_columns_follow_the_header_mapping():
+    header = storage.SNAPSHOT.names
+    header[1], header[2] = header[2], header[1]      # someone swapped first/last name
+    header = ["notes"] + header                      # and inserted a column in front
+    rec = snapshot(2, "a@x.com", 12_345.0) + ["what-if", 2]
+    by_name = dict(zip(storage.SNAPSHOT.names, rec))
+    sheet_row = [""] + [by_name[h] for h in header[1:]]
+    sheet_row[0] = "free text"
+    ws = FakeWorksheet([header, signin(1), sheet_row])
+
+    conn = mirror.connect()
+    counts = mirror.sync(conn, ws)
+    assert (counts["signins"], counts["snapshots"], counts["skipped"]) == (1, 1, 1)
+    got = conn.execute("SELECT first_name, last_name, email, sip, scenario FROM snapshots").fetchone()
+    assert got == ("First2", "Last2", "a@x.com", 12_345.0, "what-if")
+
+    # A later sync re-reads the header in the same call and applies the mapping again.
+    ws.rows.append(list(sheet_row))
+    ws.calls.clear()
+    assert mirror.sync(conn, ws, batch_rows=1, ranges_per_call=1)["snapshots"] == 1
+    assert ws.calls[0][1][0] == mirror.HEADER_RANGE
+    # After the first call the data ranges narrow to the last mapped column.
+    assert ws.calls[1][1] == [f"A5:{storage.sheets.col_letter(len(header) - 1)}5"]
+    assert conn.execute("SELECT COUNT(*) FROM snapshots WHERE first_name = 'First2'").fetchone()[0] == 2
+
+def test_rows_written_by_append_snapshots_read_back():
+    plan = compute_plan(30, 60, 90, 5.0, 50_000.0, 100_000.0, 0.0)
+    ws = FakeWorksheet()
+    storage.append_snapshots(ws, [storage.snapshot_record("2025-01-01 10:00:00", ("a", "b", "e@x", "9"), plan)])
+    conn = mirror.connect()
+    assert mirror.sync(conn, ws)["snapshots"] == 1
+    corpus, version = conn.execute("SELECT corpus, schema_version FROM snapshots").fetchone()
+    assert corpus == pytest.approx(plan.F19) and version == storage.SNAPSHOT.version
@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+from calc import Scenario, compare, compute_plan, evaluate
+from calc.scenarios import cached_plan
+from storage import Workspace, is_workspace_id, new_workspace_id, workspace_path
+
+BASE = Scenario("base", 30, 60, 90, 5.0, 50_000.0)
+LATER = Scenario("retire later", 30, 65, 90, 5.0, 50_000.0)
+RICHER = Scenario("more invested", 30, 60, 90, 5.0, 50_000.0, current_invest=5_000_000.0)
+
+
+def test_compare_deltas_are_against_the_first_scenario():
+    rows = compare([BASE, LATER, RICHER])
+    assert [r["name"] for r in rows] == ["base", "retire later", "more invested"]
+    assert rows[0]["corpus_delta"] == rows[0]["sip_delta"] == rows[0]["coverage_delta"] == 0
+
+    base = compute_plan(*BASE.inputs())
+    later = compute_plan(*LATER.inputs())
+    assert rows[1]["corpus"] == pytest.approx(later.F19)
+    assert rows[1]["corpus_delta"] == pytest.approx(later.F19 - base.F19)
+    assert rows[1]["sip_delta"] == pytest.approx(later.total_monthly_sip - base.total_monthly_sip)
+    # Existing investments lower the SIP and raise coverage.
+    assert rows[2]["sip_delta"] < 0
+    assert rows[2]["coverage_delta"] > 0
+    assert compare([]) == []
+
+def test_evaluate_only_computes_new_scenarios():
+    cached_plan.cache_clear()
+    evaluate([BASE, LATER])
+    evaluate([BASE, LATER, RICHER])
+    info = cached_plan.cache_info()
+    assert (info.misses, info.hits) == (3, 2)
+
+def test_from_plan_round_trips_inputs():
+    plan = compute_plan(*BASE.inputs())
+    assert Scenario.from_plan("base", plan) == BASE
+
+
+def test_put_replaces_by_name_and_pending_tracks_sync():
+    ws = Workspace()
+    ws.put(BASE)
+    ws.put(LATER)
+    assert ws.pending() == [BASE, LATER]
+    ws.mark_synced([BASE])
+    assert ws.pending() == [LATER]
+
+    edited = Scenario("base", 30, 58, 90, 5.0, 50_000.0)
+    ws.put(edited)
+    assert ws.names() == ["base", "retire later"]
+    assert ws.pending() == [edited, LATER]  # an edited scenario must be synced again
+    ws.remove("retire later")
+    assert ws.names() == ["base"]
+
+def test_save_load_round_trip(tmp_path):
+    path = workspace_path(new_workspace_id(), str(tmp_path))
+    ws = Workspace()
+    ws.put(BASE)
+    ws.put(RICHER)
+    ws.mark_synced([BASE, LATER])  # LATER is no longer in the workspace
+    ws.save(path)
+
+    loaded = Workspace.load(path)
+    assert loaded.scenarios == [BASE, RICHER]
+    assert loaded.synced == {BASE}
+    assert loaded.pending() == [RICHER]
+
+def test_workspace_ids_are_random_and_validated():
+    a, b = new_workspace_id(), new_workspace_id()
+    assert a != b and is_workspace_id(a)
+    assert not any(map(is_workspace_id, [None, "", "user@example.com", a.upper(), a[:-1], "../" + a[3:]]))
+    assert workspace_path(a) != workspace_path(b)
+
+def test_save_merges_what_another_session_saved(tmp_path):
+    path = str(tmp_path / "ws.json")
+    tab1, tab2 = Workspace(), Workspace()
+    tab1.put(BASE)
+    tab1.save(path)
+    tab2.put(LATER)
+    tab2.save(path)  # must not drop tab1's BASE
+    assert Workspace.load(path).names() == ["retire later", "base"]
+
+    tab1.remove("base")
+    tab1.put(RICHER)
+    tab1.save(path)  # picks up LATER; the removal sticks
+    assert tab1.names() == ["more invested", "retire later"]
+    assert Workspace.load(path).names() == ["more invested", "retire later"]
+
+    tab2.save(path)  # the stale tab doesn't bring back what tab1 removed
+    assert tab2.names() == ["retire later", "more invested"]
+    assert Workspace.load(path).names() == ["retire later", "more invested"]
+
+def test_load_missing_or_corrupt_file(tmp_path):
+    assert Workspace.load(str(tmp_path / "nope.json")).scenarios == []
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    assert Workspace.load(str(bad)).scenarios == []
+    bad.write_text("[1, 2]")
+    assert Workspace.load(str(bad)).scenarios == []
+
+def test_load_skips_stale_or_malformed_entries(tmp_path):
+    good = {"name": "ok", "age_now": 30, "age_retire": 60, "life_expectancy": 90,
+            "infl_pct": 5.0, "monthly_exp": 50_000.0, "current_invest": 0.0, "legacy_goal": 0.0}
+    path = tmp_path / "ws.json"
+    path.write_text(json.dumps({
+        "scenarios": [good, dict(good, name="extra", old_field=1), dict(good, name="typo", age_now="x"),
+                      {"age_now": 30}, "junk"],
+        "synced": [dict(good, removed=True), good],
+    }))
+    loaded = Workspace.load(str(path))
+    assert loaded.names() == ["ok"]
+    assert loaded.pending() == []
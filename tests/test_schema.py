@@ -0,0 +1,137 @@
+from datetime import datetime
+
+import pytest
+from fakes import FakeWorksheet
+
+import storage
+from calc import compute_plan
+from storage import SNAPSHOT, sheets
+
+PLAN = compute_plan(30, 60, 90, 5.0, 50_000.0, 100_000.0, 1_000_000.0)
+USER = ("Asha", "Rao", "asha@x.com", "+919800000000")
+RECORD = storage.snapshot_record("2025-01-01 10:00:00", USER, PLAN)
+
+
+@pytest.fixture(autouse=True)
+def fresh_column_cache():
+    sheets._COLUMN_MAPS.clear()
+    yield
+    sheets._COLUMN_MAPS.clear()
+
+
+def test_serialize_types_and_version():
+    values = SNAPSHOT.serialize(RECORD)
+    assert list(values) == SNAPSHOT.names
+    assert values["age_now"] == 30 and isinstance(values["age_now"], int)
+    assert isinstance(values["sip"], float)
+    assert values["scenario"] == ""
+    assert values["schema_version"] == SNAPSHOT.version
+    assert values["corpus"] == pytest.approx(PLAN.F19)
+
+def test_serialize_rejects_unknown_and_missing():
+    with pytest.raises(ValueError, match="Unknown snapshot fields: bogus"):
+        SNAPSHOT.serialize(dict(RECORD, bogus=1))
+    partial = dict(RECORD)
+    del partial["email"]
+    with pytest.raises(ValueError, match="Missing snapshot field: email"):
+        SNAPSHOT.serialize(partial)
+
+def test_first_22_columns_keep_the_legacy_order():
+    assert SNAPSHOT.required_count == 22
+    assert SNAPSHOT.names[:6] == ["ts", "first_name", "last_name", "email", "phone", "age_now"]
+    assert SNAPSHOT.names[21] == "coverage_pct"
+
+
+def test_layout_empty_header_adds_everything():
+    mapping, added = SNAPSHOT.layout([])
+    assert mapping == tuple(range(len(SNAPSHOT.columns)))
+    assert added == list(enumerate(SNAPSHOT.names))
+
+def test_layout_legacy_row_is_positional():
+    mapping, added = SNAPSHOT.layout(["2025-01-01 10:00:00", "Asha", "Rao", "a@x", "98", "SIGNIN"])
+    assert mapping == tuple(range(len(SNAPSHOT.columns)))
+    assert added == []
+
+def test_layout_named_header_maps_by_name_and_adds_missing():
+    header = ["notes"] + SNAPSHOT.names[:22]
+    header[2], header[3] = header[3], header[2]
+    mapping, added = SNAPSHOT.layout(header)
+    assert mapping[SNAPSHOT.names.index("ts")] == 1
+    assert mapping[SNAPSHOT.names.index("first_name")] == 3
+    assert mapping[SNAPSHOT.names.index("last_name")] == 2
+    assert added == [(23, "scenario"), (24, "schema_version")]
+
+def test_to_row_places_values_by_mapping():
+    header = ["notes"] + SNAPSHOT.names
+    mapping, _ = SNAPSHOT.layout(header)
+    row = SNAPSHOT.to_row(RECORD, mapping)
+    assert row[0] == ""
+    assert dict(zip(header[1:], row[1:])) == SNAPSHOT.serialize(RECORD)
+
+
+def test_column_map_empty_sheet_writes_header_once():
+    ws = FakeWorksheet()
+    storage.append_snapshot(ws, RECORD)
+    storage.append_snapshots(ws, [RECORD, dict(RECORD, scenario="s1")])
+
+    kinds = [c[0] for c in ws.calls]
+    assert kinds == ["row_values", "update", "append_rows", "append_rows"]  # header checked once
+    assert ws.calls[1][1:] == ("A1:X1", [SNAPSHOT.names], "RAW")
+    _, rows, kwargs = ws.calls[3]
+    assert kwargs == {"value_input_option": "RAW", "insert_data_option": "INSERT_ROWS",
+                      "table_range": "A1:X1"}
+    assert len(rows) == 2 and rows[1][22:] == ["s1", SNAPSHOT.version]
+    assert ws.rows[1][5] == 30 and isinstance(ws.rows[1][14], float)  # typed, not strings
+
+def test_column_map_named_header_with_missing_columns():
+    header = SNAPSHOT.names[:22]
+    header[1], header[2] = header[2], header[1]
+    ws = FakeWorksheet([header])
+    storage.append_snapshot(ws, RECORD)
+
+    assert ws.calls[1][:2] == ("update", "W1:X1")
+    assert ws.calls[1][2] == [["scenario", "schema_version"]]
+    assert ws.rows[0][22:] == ["scenario", "schema_version"]
+    assert ws.rows[1][1:3] == ["Rao", "Asha"]  # follows the swapped header
+
+def test_column_map_legacy_sheet_gets_header_inserted_above_data():
+    legacy = ["2025-01-01 10:00:00", "Asha", "Rao", "a@x", "98", "SIGNIN"]
+    ws = FakeWorksheet([legacy])
+    storage.append_snapshot(ws, RECORD)
+    assert [c[0] for c in ws.calls] == ["row_values", "insert_row", "append_rows"]
+    assert ws.calls[1][1:] == (SNAPSHOT.header(), 1, {"value_input_option": "RAW"})
+    assert ws.rows[0] == SNAPSHOT.header()
+    assert ws.rows[1] == legacy
+    assert ws.rows[2][:6] == ["2025-01-01 10:00:00", *USER, 30]
+
+def test_signin_then_snapshot_on_empty_sheet_writes_header_first(monkeypatch):
+    monkeypatch.setattr(sheets, "now_ist", lambda: "2025-01-01 09:30:00")
+    ws = FakeWorksheet()
+    storage.append_signin(ws, *USER)
+    storage.append_snapshot(ws, RECORD)
+
+    assert [c[0] for c in ws.calls] == ["row_values", "update", "append_rows", "append_rows"]
+    assert ws.rows[0] == SNAPSHOT.header()
+    assert ws.rows[1][5] == "SIGNIN"
+    assert ws.rows[2][:6] == ["2025-01-01 10:00:00", *USER, 30]
+
+def test_column_map_is_cached_per_worksheet():
+    ws = FakeWorksheet()
+    assert sheets.column_map(ws) == sheets.column_map(FakeWorksheet(ws.rows))
+    assert [c[0] for c in ws.calls] == ["row_values", "update"]
+    other = FakeWorksheet(title="Other")
+    sheets.column_map(other)
+    assert other.calls[0][0] == "row_values"
+
+
+def test_signin_is_written_raw_with_the_shared_timestamp_format(monkeypatch):
+    monkeypatch.setattr(sheets, "now_ist", lambda: "2025-01-01 09:30:00")
+    ws = FakeWorksheet()
+    storage.append_signin(ws, " Asha ", "Rao", "a@x", "+919800000000")
+    _, rows, kwargs = ws.calls[-1]
+    assert kwargs == {"value_input_option": "RAW"}
+    assert rows == [["2025-01-01 09:30:00", "Asha", "Rao", "a@x", "+919800000000", "SIGNIN"]]
+    datetime.strptime(rows[0][0], storage.TS_FORMAT)
+
+def test_col_letter():
+    assert [sheets.col_letter(i) for i in (0, 21, 23, 25, 26, 701, 702)] == ["A", "V", "X", "Z", "AA", "ZZ", "AAA"]
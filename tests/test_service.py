@@ -0,0 +1,158 @@
+import asyncio
+import json
+
+import pytest
+
+import service
+from calc import compute_plan
+
+
+def exchange(raw: bytes) -> bytes:
+    """Send one raw request to an in-process server and read until it closes."""
+    async def run():
+        server = await service.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(raw)
+            await writer.drain()
+            data = await asyncio.wait_for(reader.read(), timeout=5)
+            writer.close()
+            return data
+    return asyncio.run(run())
+
+def post(payload, version="HTTP/1.1", extra="", body=None):
+    body = json.dumps(payload).encode() if body is None else body
+    return exchange(
+        f"POST /v1/plan {version}\r\nHost: x\r\nConnection: close\r\n{extra}"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+
+def split(resp: bytes):
+    head, _, body = resp.partition(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    status = int(lines[0].split()[1])
+    headers = {k.lower(): v.strip() for k, _, v in (line.partition(":") for line in lines[1:])}
+    return status, headers, body
+
+def dechunk(body: bytes) -> bytes:
+    out = b""
+    while True:
+        size_line, _, body = body.partition(b"\r\n")
+        size = int(size_line, 16)
+        if size == 0:
+            assert body == b"\r\n"
+            return out
+        out += body[:size]
+        assert body[size:size + 2] == b"\r\n"
+        body = body[size + 2:]
+
+
+def test_single_plan_matches_calc():
+    status, _, body = split(post({"age_now": 30, "age_retire": 60, "life_expectancy": 90}))
+    assert status == 200
+    result = json.loads(body)["result"]
+    plan = compute_plan(30, 60, 90, 5.0, 50_000.0, 0.0, 0.0)
+    assert result["F19"] == pytest.approx(plan.F19)
+    assert result["F21_display"] == pytest.approx(plan.F21_display)
+    assert result["coverage"] == pytest.approx(plan.coverage)
+
+def test_single_invalid_is_400_with_field():
+    status, _, body = split(post({"age_now": 200}))
+    assert status == 400
+    assert "age_now" in json.loads(body)["error"]
+
+def test_batch_items_fail_individually():
+    status, _, body = split(post([{"age_now": 30}, {"age_now": 1e400}, {"monthly_exp": "x"}, {}]))
+    assert status == 200
+    results = json.loads(body)["results"]
+    assert "result" in results[0] and "result" in results[3]
+    assert results[1] == {"error": "age_now: expected an integer"}
+    assert results[2] == {"error": "monthly_exp: expected a number"}
+
+def test_ndjson_stream_framing_and_item_errors():
+    items = [{"age_now": 20 + i % 40} for i in range(service.STREAM_THRESHOLD * 2 + 5)]
+    items[7] = {"age_now": 1e400}
+    status, headers, body = split(post(items))
+    assert status == 200
+    assert headers["content-type"] == "application/x-ndjson"
+    assert headers["transfer-encoding"] == "chunked"
+    lines = dechunk(body).decode().splitlines()
+    assert len(lines) == len(items)
+    rows = [json.loads(line) for line in lines]
+    assert [r["index"] for r in rows] == list(range(len(items)))
+    assert rows[7]["error"] == "age_now: expected an integer"
+    assert all("result" in r for i, r in enumerate(rows) if i != 7)
+
+def test_ndjson_accept_header_small_batch():
+    status, headers, body = split(post([{}, {}], extra="Accept: application/x-ndjson\r\n"))
+    assert status == 200 and headers["transfer-encoding"] == "chunked"
+    assert len(dechunk(body).decode().splitlines()) == 2
+
+def test_http10_gets_buffered_ndjson():
+    status, headers, body = split(post([{}, {"age_now": 1}], version="HTTP/1.0",
+                                       extra="Accept: application/x-ndjson\r\n"))
+    assert status == 200
+    assert "transfer-encoding" not in headers
+    assert int(headers["content-length"]) == len(body)
+    rows = [json.loads(line) for line in body.decode().splitlines()]
+    assert "result" in rows[0] and "error" in rows[1]
+
+@pytest.mark.parametrize("length", ["abc", "-5"])
+def test_bad_content_length_is_400(length):
+    resp = exchange(f"POST /v1/plan HTTP/1.1\r\nContent-Length: {length}\r\n\r\n{{}}".encode())
+    status, _, body = split(resp)
+    assert status == 400
+    assert json.loads(body) == {"error": "bad content-length"}
+
+def test_invalid_json_and_wrong_shape():
+    assert split(post(None, body=b"{nope"))[0] == 400
+    assert split(post(42))[0] == 400
+
+def test_routing():
+    assert split(exchange(b"GET /healthz HTTP/1.1\r\nConnection: close\r\n\r\n"))[0] == 200
+    assert split(exchange(b"GET /v1/plan HTTP/1.1\r\nConnection: close\r\n\r\n"))[0] == 405
+    assert split(exchange(b"GET /nope HTTP/1.1\r\nConnection: close\r\n\r\n"))[0] == 404
+
+def test_unexpected_error_is_500(monkeypatch):
+    def boom(item):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(service, "evaluate_item", boom)
+    status, headers, body = split(post({}))
+    assert status == 500
+    assert headers["connection"] == "close"
+    assert json.loads(body) == {"error": "internal error"}
+
+def test_keep_alive_serves_pipelined_requests():
+    resp = exchange(b"GET /healthz HTTP/1.1\r\n\r\nGET /healthz HTTP/1.1\r\nConnection: close\r\n\r\n")
+    assert resp.count(b"HTTP/1.1 200 OK") == 2
+
+def test_chunked_request_body_is_refused_and_closes():
+    resp = exchange(
+        b"POST /v1/plan HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"2\r\n{}\r\n0\r\n\r\n"
+    )
+    assert resp.count(b"HTTP/1.1 ") == 1  # the chunks are not read as a second request
+    status, headers, body = split(resp)
+    assert status == 411
+    assert headers["connection"] == "close"
+    assert json.loads(body) == {"error": "send the body with Content-Length"}
+
+def test_expect_100_continue_is_answered_before_the_body():
+    async def run():
+        server = await service.serve("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"POST /v1/plan HTTP/1.1\r\nConnection: close\r\n"
+                         b"Expect: 100-continue\r\nContent-Length: 2\r\n\r\n")
+            await writer.drain()
+            interim = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5)
+            writer.write(b"{}")
+            await writer.drain()
+            rest = await asyncio.wait_for(reader.read(), timeout=5)
+            writer.close()
+            return interim, rest
+    interim, rest = asyncio.run(run())
+    assert interim == b"HTTP/1.1 100 Continue\r\n\r\n"
+    assert split(rest)[0] == 200
@@ -0,0 +1,23 @@
+from dataclasses import fields
+
+from session import SESSION_KEY, SessionModel, get_session
+
+
+def test_get_session_creates_model_with_defaults():
+    state = {}
+    ss = get_session(state)
+    assert state == {SESSION_KEY: ss}
+    assert ss == SessionModel()
+    assert ss.signed_in is False and ss.user_email == "" and ss.workspace is None
+
+def test_get_session_returns_the_same_object():
+    state = {}
+    ss = get_session(state)
+    ss.user_first_name = "Asha"
+    assert get_session(state) is ss
+    assert get_session(state).user_first_name == "Asha"
+
+def test_session_model_has_no_instance_dict():
+    ss = SessionModel()
+    assert not hasattr(ss, "__dict__")
+    assert set(SessionModel.__slots__) == {f.name for f in fields(SessionModel)}